@@ -1,314 +1,394 @@
-import requests
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import Callable, Optional
+import httpx
+import ijson
+import itertools
+import orjson
 import sys
-import json
-import time
 import os
-from datetime import datetime
+import re
+import time
+from pathlib import Path
+
+def _dumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+# Fallback to the URL in the original code
+_DEFAULT_BACKEND_URL = "https://d6b0c07a-fe05-47c2-912c-c95aec9873e8.preview.emergentagent.com"
+_BACKEND_URL_RE = re.compile(r'^REACT_APP_BACKEND_URL=(.*)$', re.MULTILINE)
+
+@functools.lru_cache(maxsize=1)
+def _get_backend_url():
+    """Get the backend URL from the frontend .env file (read once per process)"""
+    try:
+        env = Path('/app/frontend/.env').read_text()
+    except Exception as e:
+        print(f"Error reading backend URL from .env: {str(e)}")
+        return _DEFAULT_BACKEND_URL
+
+    match = _BACKEND_URL_RE.search(env)
+    if not match:
+        print("REACT_APP_BACKEND_URL is not set in /app/frontend/.env")
+        return _DEFAULT_BACKEND_URL
+    return match.group(1).strip().strip('"\'')
+
+class _AsyncByteReader:
+    """Adapt an httpx byte stream to the async read() interface ijson expects"""
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def read(self, n=-1):
+        # ijson probes the input type with read(0); answer it without consuming a chunk
+        if n == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+async def _stream_has_client_name(response, client_name):
+    """Scan a streamed status check list, stopping at the first matching client_name"""
+    async for status in ijson.items_async(_AsyncByteReader(response.aiter_bytes()), 'item'):
+        if status.get("client_name") == client_name:
+            return True
+    return False
+
+async def _read_prefix(response, limit):
+    """Read at most limit bytes of a streamed response body"""
+    body = b""
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) >= limit:
+            break
+    return body[:limit]
+
+def _validate_hello_world(data, headers):
+    if "message" in data and data["message"] == "Hello World":
+        return True, "Response contains 'Hello World' message"
+    return False, "Response does not contain expected 'Hello World' message"
+
+def _validate_is_list(data, headers):
+    if isinstance(data, list):
+        return True, f"Response contains a list of {len(data)} status checks"
+    return False, "Response is not a list of status checks"
+
+def _validate_cors_headers(data, headers):
+    if 'Access-Control-Allow-Origin' in headers:
+        return True, f"Access-Control-Allow-Origin: {headers['Access-Control-Allow-Origin']}"
+    return False, "CORS headers not found in response"
+
+def _validate_contains_client_name(client_name):
+    """Build a validator for a created status check carrying client_name"""
+    def validate_status_creation(data, headers):
+        if "id" in data and "client_name" in data and data["client_name"] == client_name:
+            return True, f"Status check created with ID: {data['id']}"
+        return False, "Response does not contain expected status check data"
+    return validate_status_creation
+
+@dataclass(frozen=True, slots=True)
+class TestCase:
+    """One request/response check; creates_status POSTs a freshly named status check"""
+    __test__ = False  # not a pytest test class
+
+    name: str
+    method: str
+    endpoint: str
+    expected: int
+    data: Optional[dict] = None
+    validate: Optional[Callable] = None
+    headers: Optional[dict] = None
+    creates_status: bool = False
+
+# Independent checks with no ordering dependency between them
+TESTS = [
+    TestCase("Root API Endpoint", "GET", "api", 200, validate=_validate_hello_world),
+    TestCase("GET Status Endpoint", "GET", "api/status", 200, validate=_validate_is_list),
+    TestCase("POST Status Endpoint", "POST", "api/status", 200, creates_status=True),
+    TestCase(
+        "CORS Configuration",
+        "OPTIONS",
+        "api",
+        200,
+        headers={
+            'Origin': 'http://example.com',
+            'Access-Control-Request-Method': 'GET',
+            'Access-Control-Request-Headers': 'Content-Type'
+        },
+        validate=_validate_cors_headers
+    ),
+    TestCase("Invalid Endpoint", "GET", "api/nonexistent", 404),
+]
 
 class BitSafeAPITester:
     def __init__(self):
         # Get backend URL from frontend .env file
-        self.base_url = self._get_backend_url()
+        self.base_url = _get_backend_url()
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = {}
+        # Per-test output is collected as (outcome, name, detail, message, payload)
+        # and only rendered once the suite has finished
+        self._log = []
+        # Unique, monotonic client names without per-test timestamp formatting
+        self._id_prefix = f"BitSafe_{os.getpid()}_{time.time_ns()}_"
+        self._id_counter = itertools.count()
+        # Independent tests run concurrently, so result bookkeeping is serialized
+        self._results_lock = asyncio.Lock()
+        # Bound connect and read time so one stalled endpoint cannot hold up the suite
+        self.timeout = httpx.Timeout(10.0, connect=3.05)
+
+        # Share one HTTP/2 client so concurrent tests multiplex streams over a single
+        # TLS connection
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            headers={'Content-Type': 'application/json'}
+        )
+
+        # Parse the URLs of the known endpoints once instead of on every request
+        self._endpoints = {
+            endpoint: httpx.URL(f"{self.base_url}/{endpoint}")
+            for endpoint in ('api', 'api/status', 'api/nonexistent')
+        }
 
-    def _get_backend_url(self):
-        """Get the backend URL from the frontend .env file"""
+    async def warm_up(self):
+        """Open the pooled connection ahead of the tests so none of them pays the handshake"""
         try:
-            with open('/app/frontend/.env', 'r') as f:
-                for line in f:
-                    if line.startswith('REACT_APP_BACKEND_URL='):
-                        return line.strip().split('=')[1].strip('"\'')
-        except Exception as e:
-            print(f"Error reading backend URL from .env: {str(e)}")
-            # Fallback to the URL in the original code
-            return "https://d6b0c07a-fe05-47c2-912c-c95aec9873e8.preview.emergentagent.com"
-
-    def run_test(self, name, method, endpoint, expected_status, data=None, validate_func=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        
+            # Any status will do; only the connection setup matters here
+            await self.client.head(self._endpoints['api'], timeout=5)
+        except httpx.HTTPError:
+            pass
+
+    async def close(self):
+        """Release the pooled connections held by the client"""
+        await self.client.aclose()
+
+    async def _record(self, name, result, passed):
+        """Record a test outcome and update the run/pass counters"""
+        async with self._results_lock:
+            self.tests_run += 1
+            if passed:
+                self.tests_passed += 1
+            self.test_results[name] = result
+
+    def _order_by(self, names):
+        """Reorder the results and log recorded so far to follow names, not completion order"""
+        position = {name: i for i, name in enumerate(names)}
+        self.test_results = dict(sorted(self.test_results.items(), key=lambda item: position[item[0]]))
+        self._log.sort(key=lambda entry: position[entry[1]])
+
+    async def _fail(self, name, exc):
+        """Log and record a test that raised, returning the failed run_test result"""
+        status = "timeout" if isinstance(exc, httpx.TimeoutException) else "failed"
+        # httpx exceptions often carry no message, so always lead with the exception type
+        error = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+        label = "Timed out" if status == "timeout" else "Error"
+        self._log.append(('fail', name, f"{label}: {error}", "", None))
+        await self._record(name, {
+            "status": status,
+            "error": error
+        }, False)
+        return False, {}
+
+    async def run_test(self, name, method, endpoint, expected_status, data=None, validate_func=None, headers=None):
+        """Run a single API test; validate_func receives the decoded body and the response headers"""
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers)
-            elif method == 'OPTIONS':
-                response = requests.options(url, headers=headers)
-
-            success = response.status_code == expected_status
-            
+            # Encode the body ourselves; the client already sends the JSON content type
+            content = orjson.dumps(data) if data is not None else None
+            url = self._endpoints.get(endpoint) or f"{self.base_url}/{endpoint}"
+            # Expected-error bodies are only previewed, never decoded, so read just their
+            # first bytes and close the stream instead of downloading the whole page
+            preview_only = expected_status >= 400
+            if preview_only:
+                async with self.client.stream(method, url, content=content, headers=headers) as response:
+                    status_code = response.status_code
+                    body = await _read_prefix(response, 256)
+            else:
+                response = await self.client.request(method, url, content=content, headers=headers)
+                status_code = response.status_code
+                body = response.content
+
+            success = status_code == expected_status
+            # Preflight responses carry only headers, never a JSON body; everything else is
+            # decoded once, and only when the server says it is JSON
+            decode_json = method != 'OPTIONS' and not preview_only
+            is_json = decode_json and 'application/json' in response.headers.get('content-type', '')
+            response_data = orjson.loads(body) if success and is_json else {}
+
             # Additional validation if provided
-            validation_result = True
             validation_message = ""
             if success and validate_func:
-                try:
-                    response_data = response.json()
-                    validation_result, validation_message = validate_func(response_data)
-                    success = success and validation_result
-                except json.JSONDecodeError:
-                    validation_result = False
-                    validation_message = "Response is not valid JSON"
+                if decode_json and not is_json:
+                    validation_message = "Response is not JSON"
                     success = False
-            
+                else:
+                    success, validation_message = validate_func(response_data, response.headers)
+
             if success:
-                self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
-                if validation_message:
-                    print(f"   {validation_message}")
-                try:
-                    response_data = response.json()
-                    print(f"   Response: {json.dumps(response_data, indent=2)[:200]}...")
-                    self.test_results[name] = {
+                if is_json:
+                    self._log.append(('pass', name, f"Status: {status_code}", validation_message, response_data))
+                    await self._record(name, {
                         "status": "passed",
                         "response": response_data
-                    }
+                    }, True)
                     return success, response_data
-                except json.JSONDecodeError:
-                    self.test_results[name] = {
-                        "status": "passed",
-                        "response": response.text[:100]
+                if method == 'OPTIONS':
+                    # A preflight's only meaningful output is its CORS headers
+                    recorded = {
+                        "cors_headers": {k: v for k, v in response.headers.items() if k.startswith('access-control-')}
                     }
-                    return success, {}
+                else:
+                    recorded = body[:100].decode('utf-8', errors='replace')
+                self._log.append(('pass', name, f"Status: {status_code}", validation_message, None))
+                await self._record(name, {
+                    "status": "passed",
+                    "response": recorded
+                }, True)
+                return success, {}
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
-                if validation_message:
-                    print(f"   {validation_message}")
-                try:
-                    print(f"   Response: {response.text[:200]}")
-                except:
-                    pass
-                self.test_results[name] = {
+                self._log.append(('fail', name, f"Expected {expected_status}, got {status_code}", validation_message,
+                                  body[:200].decode('utf-8', errors='replace')))
+                await self._record(name, {
                     "status": "failed",
-                    "error": f"Expected {expected_status}, got {response.status_code}"
-                }
+                    "error": f"Expected {expected_status}, got {status_code}"
+                }, False)
                 return False, {}
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
-            self.test_results[name] = {
-                "status": "failed",
-                "error": str(e)
-            }
-            return False, {}
+            return await self._fail(name, e)
 
-    def test_root_endpoint(self):
-        """Test the root API endpoint"""
-        def validate_hello_world(data):
-            if "message" in data and data["message"] == "Hello World":
-                return True, "Response contains 'Hello World' message"
-            return False, "Response does not contain expected 'Hello World' message"
-            
-        return self.run_test(
-            "Root API Endpoint",
-            "GET",
-            "api",
-            200,
-            validate_func=validate_hello_world
-        )
+    async def run_case(self, tc):
+        """Run a single entry of the TESTS table"""
+        data, validate = tc.data, tc.validate
+        if tc.creates_status:
+            client_name = f"{self._id_prefix}{next(self._id_counter)}"
+            data = {"client_name": client_name}
+            validate = _validate_contains_client_name(client_name)
 
-    def test_status_endpoint_get(self):
-        """Test the GET status endpoint"""
-        def validate_status_list(data):
-            if isinstance(data, list):
-                return True, f"Response contains a list of {len(data)} status checks"
-            return False, "Response is not a list of status checks"
-            
-        return self.run_test(
-            "GET Status Endpoint",
-            "GET",
-            "api/status",
-            200,
-            validate_func=validate_status_list
+        return await self.run_test(
+            tc.name,
+            tc.method,
+            tc.endpoint,
+            tc.expected,
+            data=data,
+            validate_func=validate,
+            headers=tc.headers
         )
 
-    def test_status_endpoint_post(self):
-        """Test the POST status endpoint"""
-        client_name = f"BitSafe_Test_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        def validate_status_creation(data):
-            if "id" in data and "client_name" in data and data["client_name"] == client_name:
-                return True, f"Status check created with ID: {data['id']}"
-            return False, "Response does not contain expected status check data"
-            
-        return self.run_test(
-            "POST Status Endpoint",
-            "POST",
-            "api/status",
-            200,
-            data={"client_name": client_name},
-            validate_func=validate_status_creation
-        )
-
-    def test_status_endpoint_post_then_get(self):
-        """Test POST then GET to verify data persistence"""
-        client_name = f"BitSafe_Persistence_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        # First create a status check
-        success, post_data = self.run_test(
+    async def _post_and_verify(self, client_name, deadline=2.0):
+        """POST a status check, then poll GET until it is visible or the deadline expires"""
+        success, post_data = await self.run_test(
             "POST Status for Persistence Test",
             "POST",
             "api/status",
             200,
             data={"client_name": client_name}
         )
-        
+
         if not success:
             return False, {}
-            
-        # Wait a moment to ensure data is saved
-        time.sleep(1)
-        
-        # Then get all status checks and verify our new one is there
-        def validate_status_persistence(data):
-            if not isinstance(data, list):
-                return False, "Response is not a list of status checks"
-                
-            # Look for our specific client_name
-            for status in data:
-                if "client_name" in status and status["client_name"] == client_name:
-                    return True, f"Found our status check with client_name: {client_name}"
-                    
-            return False, f"Could not find our status check with client_name: {client_name}"
-            
-        return self.run_test(
-            "Status Data Persistence Test",
-            "GET",
-            "api/status",
-            200,
-            validate_func=validate_status_persistence
-        )
 
-    def test_cors_configuration(self):
-        """Test CORS configuration by checking headers in response"""
-        url = f"{self.base_url}/api"
-        headers = {
-            'Origin': 'http://example.com',
-            'Access-Control-Request-Method': 'GET',
-            'Access-Control-Request-Headers': 'Content-Type'
-        }
-        
-        self.tests_run += 1
-        print(f"\n🔍 Testing CORS Configuration...")
-        
+        name = "Status Data Persistence Test"
+
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline
+        attempt = 0
+
         try:
-            # Make a regular GET request and check CORS headers
-            response = requests.get(url, headers=headers)
-            
-            # Check if CORS headers are present
-            has_cors_headers = 'Access-Control-Allow-Origin' in response.headers
-            
-            if has_cors_headers:
-                self.tests_passed += 1
-                print(f"✅ Passed - CORS headers found in response")
-                print(f"   Access-Control-Allow-Origin: {response.headers.get('Access-Control-Allow-Origin', 'N/A')}")
-                self.test_results["CORS Configuration"] = {
-                    "status": "passed",
-                    "response": {
-                        "cors_headers": dict([(k, v) for k, v in response.headers.items() if k.startswith('Access-Control')])
-                    }
-                }
-                return True, {}
-            else:
-                print(f"❌ Failed - CORS headers not found in response")
-                self.test_results["CORS Configuration"] = {
-                    "status": "failed",
-                    "error": "CORS headers not found in response"
-                }
-                return False, {}
-                
-        except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
-            self.test_results["CORS Configuration"] = {
+            # Poll with exponential backoff instead of a fixed sleep before a single GET
+            while True:
+                # Stream the list and stop reading as soon as our record shows up;
+                # leaving the block closes the response without draining the rest
+                async with self.client.stream("GET", self._endpoints['api/status']) as response:
+                    status_code = response.status_code
+                    found = status_code == 200 and await _stream_has_client_name(response, client_name)
+
+                if found:
+                    self._log.append(('pass', name, f"Status: {status_code}",
+                                      f"Found our status check with client_name: {client_name}", None))
+                    await self._record(name, {
+                        "status": "passed",
+                        "response": {"client_name": client_name, "attempts": attempt + 1}
+                    }, True)
+                    return True, post_data
+
+                remaining = expires_at - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(0.05 * 2 ** attempt, remaining))
+                attempt += 1
+
+            self._log.append(('fail', name, f"Could not find our status check with client_name: {client_name}", "", None))
+            await self._record(name, {
                 "status": "failed",
-                "error": str(e)
-            }
+                "error": f"Status check {client_name} not visible after {deadline}s (last status {status_code})"
+            }, False)
             return False, {}
 
-    def test_invalid_endpoint(self):
-        """Test an invalid endpoint to verify error handling"""
-        return self.run_test(
-            "Invalid Endpoint",
-            "GET",
-            "api/nonexistent",
-            404
-        )
+        except Exception as e:
+            return await self._fail(name, e)
 
-    def test_mongodb_integration(self):
-        """Test MongoDB integration by creating and retrieving data"""
-        # This test is covered by test_status_endpoint_post_then_get
-        # but we'll add a specific test for MongoDB integration
-        
-        # Create a unique client name
-        client_name = f"BitSafe_MongoDB_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        # Create a status check
-        success1, post_data = self.run_test(
-            "MongoDB Integration - Create",
-            "POST",
-            "api/status",
-            200,
-            data={"client_name": client_name}
-        )
-        
-        if not success1:
-            return False, {}
-            
-        # Wait a moment to ensure data is saved
-        time.sleep(1)
-        
-        # Verify we can retrieve it
-        def validate_mongodb_retrieval(data):
-            if not isinstance(data, list):
-                return False, "Response is not a list of status checks"
-                
-            # Look for our specific client_name
-            for status in data:
-                if "client_name" in status and status["client_name"] == client_name:
-                    return True, f"MongoDB integration verified - found status with client_name: {client_name}"
-                    
-            return False, f"MongoDB integration failed - could not find status with client_name: {client_name}"
-            
-        return self.run_test(
-            "MongoDB Integration - Retrieve",
-            "GET",
-            "api/status",
-            200,
-            validate_func=validate_mongodb_retrieval
-        )
+    async def test_status_endpoint_post_then_get(self):
+        """Test POST then GET to verify data persistence in MongoDB"""
+        client_name = f"{self._id_prefix}{next(self._id_counter)}"
+        return await self._post_and_verify(client_name)
 
-def main():
+async def run_all(tester):
+    # Independent tests have no ordering dependency, so overlap their network waits
+    await asyncio.gather(*(tester.run_case(tc) for tc in TESTS))
+    # Report in table order however the concurrent tests happened to finish
+    tester._order_by([tc.name for tc in TESTS])
+
+    # The write-then-read test depends on its own POST landing first
+    await tester.test_status_endpoint_post_then_get()
+
+async def run_suite():
     # Setup
     tester = BitSafeAPITester()
-    
+
     print("\n🔒 BitSafe Crypto Insurance API Test Suite 🔒")
     print("=============================================")
-    
+
     # Run tests
-    tester.test_root_endpoint()
-    tester.test_status_endpoint_get()
-    tester.test_status_endpoint_post()
-    tester.test_status_endpoint_post_then_get()
-    tester.test_cors_configuration()
-    tester.test_invalid_endpoint()
-    tester.test_mongodb_integration()
+    try:
+        await tester.warm_up()
+        await run_all(tester)
+    finally:
+        await tester.close()
+
+    return tester
+
+def main():
+    tester = asyncio.run(run_suite())
+
+    # Render the per-test output collected during the run to stderr, one write per test
+    sys.stdout.flush()
+    for outcome, name, detail, message, payload in tester._log:
+        parts = [
+            f"\n🔍 Testing {name}...",
+            f"{'✅ Passed' if outcome == 'pass' else '❌ Failed'} - {detail}"
+        ]
+        if message:
+            parts.append(f"   {message}")
+        if isinstance(payload, str):
+            parts.append(f"   Response: {payload}")
+        elif payload is not None:
+            parts.append(f"   Response: {_dumps(payload)[:200]}...")
+        sys.stderr.write('\n'.join(parts) + '\n')
+    sys.stderr.flush()
 
     # Print results
     print("\n📊 Test Results Summary:")
     print("=============================================")
     print(f"Tests passed: {tester.tests_passed}/{tester.tests_run}")
-    
+
     # Print detailed results
     for name, result in tester.test_results.items():
         status = "✅" if result["status"] == "passed" else "❌"
         print(f"{status} {name}")
-    
+
     return 0 if tester.tests_passed == tester.tests_run else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
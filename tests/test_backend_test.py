@@ -0,0 +1,77 @@
+import asyncio
+
+import orjson
+
+from backend_test import _BACKEND_URL_RE, _read_prefix, _stream_has_client_name
+
+
+class FakeStreamResponse:
+    """Stand-in for a streamed httpx response that yields a fixed body in small chunks"""
+    def __init__(self, body, chunk_size):
+        self.chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.chunks_read = 0
+
+    async def aiter_bytes(self):
+        for chunk in self.chunks:
+            self.chunks_read += 1
+            yield chunk
+
+
+def _status_list(count):
+    return orjson.dumps([
+        {"id": str(i), "client_name": f"client_{i}", "timestamp": "2024-01-01T00:00:00"}
+        for i in range(count)
+    ])
+
+
+def test_stream_finds_client_name_across_chunks():
+    response = FakeStreamResponse(_status_list(40), chunk_size=7)
+    assert asyncio.run(_stream_has_client_name(response, "client_39"))
+
+
+def test_stream_finds_client_name_in_single_chunk():
+    # The whole body arrives as the first chunk, so nothing may be consumed before parsing
+    body = _status_list(3)
+    response = FakeStreamResponse(body, chunk_size=len(body))
+    assert asyncio.run(_stream_has_client_name(response, "client_0"))
+
+
+def test_stream_stops_reading_at_first_match():
+    response = FakeStreamResponse(_status_list(40), chunk_size=16)
+    assert asyncio.run(_stream_has_client_name(response, "client_0"))
+    assert response.chunks_read < len(response.chunks)
+
+
+def test_stream_reports_missing_client_name():
+    response = FakeStreamResponse(_status_list(40), chunk_size=7)
+    assert not asyncio.run(_stream_has_client_name(response, "client_missing"))
+
+
+def test_stream_reports_missing_client_name_for_non_list():
+    response = FakeStreamResponse(orjson.dumps({"detail": "Not Found"}), chunk_size=5)
+    assert not asyncio.run(_stream_has_client_name(response, "client_0"))
+
+
+def test_read_prefix_stops_at_limit():
+    response = FakeStreamResponse(b"x" * 1000, chunk_size=100)
+    assert asyncio.run(_read_prefix(response, 256)) == b"x" * 256
+    assert response.chunks_read == 3
+
+
+def test_read_prefix_returns_short_body_whole():
+    response = FakeStreamResponse(b"Not Found", chunk_size=4)
+    assert asyncio.run(_read_prefix(response, 256)) == b"Not Found"
+
+
+def test_backend_url_only_matches_at_line_start():
+    env = (
+        "# REACT_APP_BACKEND_URL=https://commented.example.com\n"
+        "FOO_REACT_APP_BACKEND_URL=https://prefixed.example.com\n"
+        "REACT_APP_BACKEND_URL=\"https://real.example.com\"\n"
+    )
+    match = _BACKEND_URL_RE.search(env)
+    assert match.group(1).strip().strip('"\'') == "https://real.example.com"
+
+
+def test_backend_url_missing_key_does_not_match():
+    assert _BACKEND_URL_RE.search("FOO_REACT_APP_BACKEND_URL=https://prefixed.example.com\n") is None